@@ -257,3 +257,19 @@ def get_openai_organization() -> str:
         raise RuntimeError("OPENAI_ORGANIZATION is not set.")
 
     return org
+
+
+@functools.cache
+def is_ssml_check_enabled() -> bool:
+    """Whether to validate generated SSML by parsing it before synthesis."""
+    return os.environ.get("FREESPEECH_SSML_CHECKS", "").lower() in ("1", "true")
+
+
+@functools.cache
+def is_tts_voice_check_enabled() -> bool:
+    """Whether to check voices against the list of the TTS provider's voices.
+
+    Enabled unless FREESPEECH_VALIDATE_TTS_VOICES is set to "0" or "false".
+    """
+    value = os.environ.get("FREESPEECH_VALIDATE_TTS_VOICES", "1")
+    return value.lower() not in ("0", "false")
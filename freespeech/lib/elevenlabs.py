@@ -23,11 +23,21 @@ async def change_speech_rate(speech_file: Path, rate: float) -> Path:
     return Path(audio.resample(str(wav), new_duration, str(wav.parent)))
 
 
-async def synthesize(text: str, voice: str, rate: float, output: Path) -> Path:
-    """Synthesize speech from text input."""
+async def synthesize(
+    text: str,
+    voice: str,
+    rate: float,
+    output: Path,
+    voices: dict[str, str] | None = None,
+) -> Path:
+    """Synthesize speech from text input.
+
+    `voices` are looked up with `get_voices` unless given.
+    """
     api_key = env.get_elevenlabs_key()
 
-    voices = await get_voices()
+    if voices is None:
+        voices = await get_voices()
     if voice not in voices:
         raise ValueError(f"Voice {voice} not available.")
     voice_id = voices[voice]
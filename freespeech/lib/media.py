@@ -1,5 +1,8 @@
+import io
 import logging
 import uuid
+import wave
+from contextlib import ExitStack
 from os import PathLike, system
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -95,6 +98,22 @@ def probe(file: str | PathLike) -> Tuple[Sequence[Audio], Sequence[Video]]:
     )
 
 
+def wav_duration_ms(file: str | PathLike) -> int | None:
+    """Get duration of a PCM WAV file from its header without running ffprobe.
+
+    Args:
+        file: path to a local file.
+
+    Returns:
+        Duration in milliseconds, or None if file is not a PCM WAV.
+    """
+    try:
+        with wave.open(str(file), "rb") as wav:
+            return wav.getnframes() * 1000 // wav.getframerate()
+    except (wave.Error, EOFError):
+        return None
+
+
 def new_file(dir: str | PathLike) -> PathLike:
     return Path(dir) / str(uuid.uuid4())
 
@@ -183,6 +202,75 @@ async def concat(clips: Sequence[str], output_dir: str | PathLike) -> Path:
     return await concat_and_pad([(0, clip) for clip in clips], output_dir)
 
 
+async def concat_wav(
+    clips: Sequence[str | PathLike | bytes], output_dir: str | PathLike
+) -> Path:
+    """Concatenate PCM WAV clips by appending their samples.
+
+    Avoids running ffmpeg when all clips share the same number of channels,
+    sample width and rate, which is the case for TTS output. Otherwise
+    falls back to `concat`.
+
+    Args:
+        clips: list of paths to WAV files or contents of WAV files.
+        output_dir: directory to store the conversion result.
+
+    Returns:
+        Path to audio file with concatenated clips.
+    """
+    output_file = Path(f"{new_file(output_dir)}.wav")
+
+    if await concurrency.run_in_thread_pool(_append_wav_frames, clips, output_file):
+        return output_file
+
+    with TemporaryDirectory() as tmp_dir:
+        files = []
+        for clip in clips:
+            if isinstance(clip, bytes):
+                file = Path(f"{new_file(tmp_dir)}.wav")
+                file.write_bytes(clip)
+                clip = file
+            files += [str(clip)]
+
+        return await concat(files, output_dir)
+
+
+def _append_wav_frames(
+    clips: Sequence[str | PathLike | bytes], output_file: Path
+) -> bool:
+    with ExitStack() as stack:
+        try:
+            readers = [
+                stack.enter_context(
+                    wave.open(
+                        io.BytesIO(clip) if isinstance(clip, bytes) else str(clip),
+                        "rb",
+                    )
+                )
+                for clip in clips
+            ]
+        except (wave.Error, EOFError):
+            return False
+
+        formats = {
+            (reader.getnchannels(), reader.getsampwidth(), reader.getframerate())
+            for reader in readers
+        }
+        if len(formats) != 1:
+            return False
+
+        ((num_channels, sample_width, sample_rate),) = formats
+        with wave.open(str(output_file), "wb") as writer:
+            writer.setnchannels(num_channels)
+            writer.setsampwidth(sample_width)
+            writer.setframerate(sample_rate)
+            writer.setnframes(sum(reader.getnframes() for reader in readers))
+            for reader in readers:
+                writer.writeframesraw(reader.readframes(reader.getnframes()))
+
+    return True
+
+
 async def mix(
     files: Sequence[str | PathLike],
     weights: Sequence[int],
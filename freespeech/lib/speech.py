@@ -1,17 +1,22 @@
 import asyncio
-import difflib
+import io
 import json
 import logging
 import os
+import random
 import re
 import shutil
+import time
+import wave
 import xml.etree.ElementTree as ET
 from dataclasses import replace
-from functools import cache, reduce
-from itertools import groupby
+from functools import cache
+from itertools import chain, groupby
+from operator import itemgetter
 from pathlib import Path
-from tempfile import TemporaryDirectory
-from typing import Dict, Sequence, Tuple
+from tempfile import TemporaryDirectory, gettempdir
+from types import MappingProxyType
+from typing import Any, Awaitable, Dict, Mapping, Sequence, Tuple
 from uuid import uuid4
 
 import aiohttp
@@ -22,19 +27,21 @@ from google.cloud import speech as speech_api
 from google.cloud import texttospeech as google_tts
 from google.cloud.speech_v1.types.cloud_speech import LongRunningRecognizeResponse
 from pydantic.dataclasses import dataclass
+from rapidfuzz.distance import Indel
 
 import freespeech.lib.hash as hash
 from freespeech import env
-from freespeech.lib import concurrency, elevenlabs, media
+from freespeech.lib import elevenlabs, media
 from freespeech.lib.storage import obj
 from freespeech.lib.text import (
     capitalize_sentence,
     chunk,
     is_sentence,
-    lemmas,
+    lemmas_batch,
     make_sentence,
     remove_symbols,
     sentences,
+    sentences_batch,
     split_sentences,
 )
 from freespeech.types import (
@@ -373,6 +380,19 @@ VOICES: Dict[Character, Dict[Language, Tuple[ServiceProvider, str] | None]] = {
     },
 }
 
+# Read-only (character, lang) -> (provider, voice) view of VOICES
+# for a single lookup per synthesis. Unsupported pairs are left out.
+_VOICES_FLAT: Mapping[Tuple[Character, Language], Tuple[ServiceProvider, str]] = (
+    MappingProxyType(
+        {
+            (character, lang): provider_and_voice
+            for character, voices in VOICES.items()
+            for lang, provider_and_voice in voices.items()
+            if provider_and_voice
+        }
+    )
+)
+
 GOOGLE_CLOUD_ENCODINGS = {
     "LINEAR16": speech_api.RecognitionConfig.AudioEncoding.LINEAR16,
     "WEBM_OPUS": speech_api.RecognitionConfig.AudioEncoding.WEBM_OPUS,
@@ -381,6 +401,12 @@ GOOGLE_CLOUD_ENCODINGS = {
 # Any speech break less than this value will be ignored.
 MINIMUM_SPEECH_BREAK_MS = 50
 
+# Punctuation that ends a sentence, suitable for str.endswith().
+_SENT_END = (".", "!", "?")
+
+# Speech break markup in text, e.g. "#1.5#" is a 1.5 second break.
+_BREAK_RE = re.compile(r"#(\d+(?:\.\d+)?)#")
+
 # When synthesizing speech to match duration, this is the maximum delta.
 SYNTHESIS_ERROR_MS = 200
 
@@ -393,12 +419,32 @@ SYNTHESIS_RETRIES = 10
 # Number of retries when making a request to speech API.
 API_RETRIES = 3
 
+# Maximum number of events synthesized at the same time.
+SYNTHESIS_CONCURRENCY = 8
+
+# Maximum number of chunks synthesized at the same time across all events.
+SYNTHESIS_CHUNK_CONCURRENCY = 8
+
+# Maximum number of events synthesized with ElevenLabs at the same time.
+# Its API rejects requests over the rate limit instead of queueing them.
+ELEVENLABS_CONCURRENCY = 1
+
 # Speech-to-text API call timeout.
 # Upper limit is 480 minutes
 # Details: https://cloud.google.com/speech-to-text/docs/async-recognize#speech_transcribe_async_gcs-python  # noqa: E501
 GOOGLE_TRANSCRIBE_TIMEOUT_SEC = 480 * 60
 AZURE_TRANSCRIBE_TIMEOUT_SEC = 60 * 60
 
+# How long the service waits for TTS providers when it starts.
+WARM_UP_TIMEOUT_SEC = 5
+
+# How long lists of voices supported by TTS providers are kept on disk.
+VOICES_CACHE_TTL_SEC = 24 * 60 * 60
+
+# Bounds of the exponential backoff when polling transcription jobs.
+AZURE_POLL_MIN_DELAY_SEC = 1.0
+AZURE_POLL_MAX_DELAY_SEC = 30.0
+
 SSML_EMOTIONS = {
     "😌": "calm",
     "🙂": "calm",
@@ -410,31 +456,197 @@ SSML_EMOTIONS = {
     "😠": "angry",
 }
 
+# Emotion emojis, along with surrounding whitespace and trailing dots.
+_EMOJI_SUB_RE = re.compile(rf"\s*[{''.join(SSML_EMOTIONS)}]\s*\.*")
+# Emotion emojis, along with subsequent whitespace and punctuation.
+_EMOJI_SPLIT_RE = re.compile(rf"([{''.join(SSML_EMOTIONS)}]\s*[.!?,;:]*)")
+_PUNCT_TAIL_RE = re.compile(r"[.?!]+")
+
 CACHE_SIZE = 0
 
+# Azure HTTP sessions shared across chunks and calls, keyed by region.
+# Each session is bound to the event loop it was created in.
+_AZURE_SESSIONS: Dict[str, Tuple[asyncio.AbstractEventLoop, aiohttp.ClientSession]] = {}
+
+
+def _get_azure_session(region: str) -> aiohttp.ClientSession:
+    """Get a pooled `aiohttp.ClientSession` for Azure `region`.
+
+    Reusing the session keeps connections alive between requests and saves
+    a TCP+TLS handshake per request. A new session is created if the
+    running event loop has changed since the last call.
+    """
+    loop = asyncio.get_running_loop()
+    if region in _AZURE_SESSIONS:
+        session_loop, session = _AZURE_SESSIONS[region]
+        if session_loop is loop and not session.closed:
+            return session
+
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=32, keepalive_timeout=60, ttl_dns_cache=300
+        )
+    )
+    _AZURE_SESSIONS[region] = (loop, session)
+    return session
+
+
+async def close_azure_sessions() -> None:
+    """Close pooled Azure sessions bound to the running event loop.
+
+    Call it before the loop is closed, e.g. on application shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    for region, (session_loop, session) in list(_AZURE_SESSIONS.items()):
+        if session_loop is loop:
+            del _AZURE_SESSIONS[region]
+            await session.close()
+
+
+@cache
+def _google_tts_client() -> google_tts.TextToSpeechClient:
+    # gRPC clients are thread-safe and can be shared across thread pool workers.
+    return google_tts.TextToSpeechClient()
+
+
+# gRPC asyncio channels are bound to the event loop they were created in.
+_GOOGLE_TTS_ASYNC_CLIENT: Tuple[
+    asyncio.AbstractEventLoop, google_tts.TextToSpeechAsyncClient
+] | None = None
+
+
+def _google_tts_async_client() -> google_tts.TextToSpeechAsyncClient:
+    """Get a shared `TextToSpeechAsyncClient` for the running event loop."""
+    global _GOOGLE_TTS_ASYNC_CLIENT
+
+    loop = asyncio.get_running_loop()
+    if _GOOGLE_TTS_ASYNC_CLIENT is not None:
+        client_loop, client = _GOOGLE_TTS_ASYNC_CLIENT
+        if client_loop is loop:
+            return client
+
+    client = google_tts.TextToSpeechAsyncClient()
+    _GOOGLE_TTS_ASYNC_CLIENT = (loop, client)
+    return client
+
+
+_GOOGLE_SPEECH_ASYNC_CLIENT: Tuple[
+    asyncio.AbstractEventLoop, speech_api.SpeechAsyncClient
+] | None = None
+
+
+def _google_speech_async_client() -> speech_api.SpeechAsyncClient:
+    """Get a shared `SpeechAsyncClient` for the running event loop."""
+    global _GOOGLE_SPEECH_ASYNC_CLIENT
+
+    loop = asyncio.get_running_loop()
+    if _GOOGLE_SPEECH_ASYNC_CLIENT is not None:
+        client_loop, client = _GOOGLE_SPEECH_ASYNC_CLIENT
+        if client_loop is loop:
+            return client
+
+    client = speech_api.SpeechAsyncClient()
+    _GOOGLE_SPEECH_ASYNC_CLIENT = (loop, client)
+    return client
+
+
+def _voices_cache_path(name: str) -> Path:
+    return Path(gettempdir()) / f"freespeech-voices-{name}.json"
+
+
+def _read_cached_voices(name: str) -> Dict[str, Sequence[str]] | None:
+    path = _voices_cache_path(name)
+    try:
+        if time.time() - path.stat().st_mtime < VOICES_CACHE_TTL_SEC:
+            return json.loads(path.read_text())
+    except (OSError, json.JSONDecodeError):
+        # Missing or not readable, e.g. created by another user
+        # in the shared temp dir. The voices are requested from the API.
+        pass
+    return None
+
+
+def _write_cached_voices(name: str, voices: Dict[str, Sequence[str]]) -> None:
+    path = _voices_cache_path(name)
+    tmp_path = path.with_name(f"{path.name}.{uuid4()}")
+    try:
+        tmp_path.write_text(json.dumps(voices))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Unable to cache {name} voices: {e}")
+        tmp_path.unlink(missing_ok=True)
+
 
 @cache
 def supported_google_voices() -> Dict[str, Sequence[str]]:
-    client = google_tts.TextToSpeechClient()
+    if (voices := _read_cached_voices("google")) is not None:
+        return voices
+
+    client = _google_tts_client()
 
     # Performs the list voices request
     response = client.list_voices()
 
-    return {voice.name: voice.language_codes for voice in response.voices}
+    voices = {voice.name: list(voice.language_codes) for voice in response.voices}
+    _write_cached_voices("google", voices)
+    return voices
+
+
+# Azure voices for each region, loaded once per process.
+_AZURE_VOICES: Dict[str, Dict[str, Sequence[str]]] = {}
 
 
 async def supported_azure_voices() -> Dict[str, Sequence[str]]:
     azure_key, azure_region = env.get_azure_config()
-    headers = {
-        "Ocp-Apim-Subscription-Key": azure_key,
-    }
-    url = f"https://{azure_region}.tts.speech.microsoft.com"
-    async with aiohttp.ClientSession(url, headers=headers) as session:
-        async with session.get("/cognitiveservices/voices/list") as response:
+    if azure_region in _AZURE_VOICES:
+        return _AZURE_VOICES[azure_region]
+
+    cache_name = f"azure-{azure_region}"
+    voices = await asyncio.to_thread(_read_cached_voices, cache_name)
+    if voices is None:
+        headers = {
+            "Ocp-Apim-Subscription-Key": azure_key,
+        }
+        url = f"https://{azure_region}.tts.speech.microsoft.com"
+        session = _get_azure_session(azure_region)
+        async with session.get(
+            f"{url}/cognitiveservices/voices/list", headers=headers
+        ) as response:
             if not response.ok:
                 raise RuntimeError(await response.text())
-            voices = await response.json()
-    return {voice["ShortName"]: voice["Locale"] for voice in voices}
+            result = await response.json()
+        voices = {voice["ShortName"]: voice["Locale"] for voice in result}
+        await asyncio.to_thread(_write_cached_voices, cache_name, voices)
+
+    _AZURE_VOICES[azure_region] = voices
+    return voices
+
+
+async def warm_up() -> None:
+    """Prepare TTS providers ahead of the first synthesis request.
+
+    Opens the shared Google gRPC channel and loads the lists of voices
+    used to check voices before synthesis. Failures and timeouts are only
+    logged, so that missing credentials or an unreachable provider don't
+    prevent the service from starting.
+    """
+
+    async def _google() -> None:
+        await _google_tts_async_client().list_voices(language_code="en-US")
+
+    warm_ups: Dict[str, Awaitable[Any]] = {"Google TTS": _google()}
+    if env.is_tts_voice_check_enabled():
+        # The first call makes a blocking gRPC request, keep it off the loop.
+        warm_ups["Google voices"] = asyncio.to_thread(supported_google_voices)
+        warm_ups["Azure voices"] = supported_azure_voices()
+
+    results = await asyncio.gather(
+        *[asyncio.wait_for(aw, WARM_UP_TIMEOUT_SEC) for aw in warm_ups.values()],
+        return_exceptions=True,
+    )
+    for name, result in zip(warm_ups, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Unable to warm up {name}: {result!r}")
 
 
 async def transcribe(
@@ -490,6 +702,9 @@ async def _transcribe_deepgram(file: Path, lang: Language, model: TranscriptionM
 
     deepgram = Deepgram(env.get_deepgram_token())
 
+    # Passing the file object rather than its contents lets aiohttp stream
+    # the upload in chunks read off the event loop. Note that the SDK doesn't
+    # retry failed requests with a stream payload.
     with open(file, "rb") as buffer:
         source = {"buffer": buffer, "mimetype": mime_type}
         response = await deepgram.transcription.prerecorded(
@@ -518,7 +733,7 @@ async def _transcribe_deepgram(file: Path, lang: Language, model: TranscriptionM
             chunks=[utterance["transcript"]],
             voice=Voice(character=character),
         )
-        events += [event]
+        events.append(event)
 
     return events
 
@@ -526,38 +741,33 @@ async def _transcribe_deepgram(file: Path, lang: Language, model: TranscriptionM
 async def _transcribe_google(
     file: Path, lang: Language, model: TranscriptionModel
 ) -> Sequence[Event]:
-    client = speech_api.SpeechClient()
+    client = _google_speech_async_client()
     uri = await obj.put(file, f"{env.get_storage_url()}/transcribe_google/{file.name}")
     try:
-
-        def _api_call() -> LongRunningRecognizeResponse:
-            operation = client.long_running_recognize(
-                config=speech_api.RecognitionConfig(
-                    # NOTE (astaff, 20220728): apparently Google Cloud doesn't
-                    # need those and calculates everything on the fly.
-                    # audio_channel_count=num_channels,
-                    # encoding=GOOGLE_CLOUD_ENCODINGS[encoding],
-                    # sample_rate_hertz=sample_rate_hz,
-                    language_code=lang,
-                    model=model,
-                    enable_automatic_punctuation=True,
-                    # TODO (astaff): are there any measurable gains
-                    # from adjusting the hyper parameters?
-                    # metadata=speech_api.RecognitionMetadata(
-                    #     recording_device_type=speech_api.RecognitionMetadata.RecordingDeviceType.SMARTPHONE,  # noqa: E501
-                    #     original_media_type=speech_api.RecognitionMetadata.OriginalMediaType.VIDEO,  # noqa: E501
-                    # )
-                ),
-                audio=speech_api.RecognitionAudio(uri=uri),
-            )
-            result = operation.result(timeout=GOOGLE_TRANSCRIBE_TIMEOUT_SEC)  # type: ignore  # noqa: E501
-            assert isinstance(
-                result, LongRunningRecognizeResponse
-            ), f"type(result)={type(result)}"
-
-            return result
-
-        response = await concurrency.run_in_thread_pool(_api_call)
+        operation = await client.long_running_recognize(
+            config=speech_api.RecognitionConfig(
+                # NOTE (astaff, 20220728): apparently Google Cloud doesn't
+                # need those and calculates everything on the fly.
+                # audio_channel_count=num_channels,
+                # encoding=GOOGLE_CLOUD_ENCODINGS[encoding],
+                # sample_rate_hertz=sample_rate_hz,
+                language_code=lang,
+                model=model,
+                enable_automatic_punctuation=True,
+                # TODO (astaff): are there any measurable gains
+                # from adjusting the hyper parameters?
+                # metadata=speech_api.RecognitionMetadata(
+                #     recording_device_type=speech_api.RecognitionMetadata.RecordingDeviceType.SMARTPHONE,  # noqa: E501
+                #     original_media_type=speech_api.RecognitionMetadata.OriginalMediaType.VIDEO,  # noqa: E501
+                # )
+            ),
+            audio=speech_api.RecognitionAudio(uri=uri),
+        )
+        # Polls the operation without blocking a thread for up to hours.
+        response = await operation.result(timeout=GOOGLE_TRANSCRIBE_TIMEOUT_SEC)
+        assert isinstance(
+            response, LongRunningRecognizeResponse
+        ), f"type(response)={type(response)}"
     except google_api_exceptions.NotFound:
         raise ValueError(f"Requested entity not found {uri}")
 
@@ -572,7 +782,7 @@ async def _transcribe_google(
             chunks=[result.alternatives[0].transcript],
         )
         current_time_ms = end_time_ms
-        events += [event]
+        events.append(event)
     return events
 
 
@@ -584,28 +794,25 @@ def transform_azure_result(
     """
     time_ms = phrase.offsetInTicks // 10000
     duration_ms = phrase.durationInTicks // 10000
-    text = phrase.nBest[0].display
+    best = phrase.nBest[0]
+    text = best.display
+    character = CHARACTERS[phrase.speaker]
 
     match model:
         case "default_granular":
+            words = [
+                (word.word, word.offsetInTicks // 10000, word.durationInTicks // 10000)
+                for word in best.words
+            ]
             return [
                 Event(
                     time_ms=time_ms,
                     chunks=[sentence],
                     duration_ms=duration_ms,
-                    voice=Voice(character=CHARACTERS[phrase.speaker]),
+                    voice=Voice(character=character),
                 )
                 for sentence, time_ms, duration_ms in break_phrase(
-                    text=text,
-                    words=[
-                        (
-                            word.word,
-                            word.offsetInTicks // 10000,
-                            word.durationInTicks // 10000,
-                        )
-                        for word in phrase.nBest[0].words
-                    ],
-                    lang=lang,
+                    text=text, words=words, lang=lang
                 )
             ]
         case "default":
@@ -614,7 +821,7 @@ def transform_azure_result(
                     time_ms=time_ms,
                     chunks=[text],
                     duration_ms=duration_ms,
-                    voice=Voice(character=CHARACTERS[phrase.speaker]),
+                    voice=Voice(character=character),
                 )
             ]
         case "latest_long" | "general" | "whisper-large":
@@ -644,60 +851,80 @@ async def _transcribe_azure(file: Path, lang: Language, model: TranscriptionMode
         "displayName": f"Transcription using default model for {lang}",
     }
 
-    async with aiohttp.ClientSession(
-        f"https://{region}.api.cognitive.microsoft.com", headers=headers
-    ) as session:
-        # Submit transcription job
-        async with session.post(
-            "/speechtotext/v3.0/transcriptions", json=body
+    url = f"https://{region}.api.cognitive.microsoft.com/speechtotext/v3.0"
+    session = _get_azure_session(region)
+
+    # Submit transcription job
+    async with session.post(
+        f"{url}/transcriptions", headers=headers, json=body
+    ) as response:
+        result = await response.json()
+        if not response.ok:
+            raise RuntimeError(result["message"])
+        transcription_id = response.headers["location"].split("/")[-1]
+
+    # Monitor job status and wait for Succeeded.
+    # Poll often at first and back off for longer jobs.
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + AZURE_TRANSCRIBE_TIMEOUT_SEC
+    delay_sec = AZURE_POLL_MIN_DELAY_SEC
+    while loop.time() < deadline:
+        async with session.get(
+            f"{url}/transcriptions/{transcription_id}", headers=headers
         ) as response:
             result = await response.json()
             if not response.ok:
                 raise RuntimeError(result["message"])
-            transcription_id = response.headers["location"].split("/")[-1]
-
-        # Monitor job status and wait for Succeeded
-        time_elapsed_sec = 0.0
-        while time_elapsed_sec < AZURE_TRANSCRIBE_TIMEOUT_SEC:
-            async with session.get(
-                f"/speechtotext/v3.0/transcriptions/{transcription_id}"
-            ) as response:
-                result = await response.json()
-                if not response.ok:
-                    raise RuntimeError(result["message"])
 
-                if result["status"] == "Succeeded":
-                    break
-                elif result["status"] == "Failed":
-                    raise RuntimeError(f"Transcription job {transcription_id} failed!")
+            if result["status"] == "Succeeded":
+                break
+            elif result["status"] == "Failed":
+                raise RuntimeError(f"Transcription job {transcription_id} failed!")
 
-            time_elapsed_sec += 5.0
-            await asyncio.sleep(5.0)
+        await asyncio.sleep(delay_sec + random.uniform(0, delay_sec * 0.1))
+        delay_sec = min(delay_sec * 1.8, AZURE_POLL_MAX_DELAY_SEC)
 
-        # For successful job, retrieve the actual content URL
-        async with session.get(
-            f"/speechtotext/v3.0/transcriptions/{transcription_id}/files"
-        ) as response:
-            result = await response.json()
-            if not response.ok:
-                raise RuntimeError(result["message"])
-            content_url = result["values"][0]["links"]["contentUrl"]
+    # For successful job, retrieve the actual content URL
+    async with session.get(
+        f"{url}/transcriptions/{transcription_id}/files", headers=headers
+    ) as response:
+        result = await response.json()
+        if not response.ok:
+            raise RuntimeError(result["message"])
+        content_url = result["values"][0]["links"]["contentUrl"]
 
-    async with aiohttp.ClientSession(headers=headers) as session:
-        async with session.get(content_url) as response:
-            result = await response.json()
+    async with session.get(content_url, headers=headers) as response:
+        result = await response.json()
 
     # Flatten the result
-    return sum(
-        [
+    return list(
+        chain.from_iterable(
             transform_azure_result(RecognizedPhrase(**phrase), lang, model)
             for phrase in result["recognizedPhrases"]
             if "duration" in phrase  # filter out empty phrases
-        ],
-        [],
+        )
     )
 
 
+def _audio_duration_ms(file: str | Path) -> int:
+    # Read the WAV header when possible, it's much cheaper than ffprobe.
+    duration_ms = media.wav_duration_ms(file)
+    if duration_ms is not None:
+        return duration_ms
+
+    (audio, *_), _ = media.probe(file)
+    assert isinstance(audio, Audio)
+    return audio.duration_ms
+
+
+def _is_pcm_wav(data: bytes) -> bool:
+    try:
+        with wave.open(io.BytesIO(data), "rb") as wav:
+            return wav.getnframes() > 0
+    except (wave.Error, EOFError):
+        return False
+
+
 def is_valid_ssml(text: str) -> bool:
     try:
         root = ET.fromstring(text)
@@ -707,12 +934,21 @@ def is_valid_ssml(text: str) -> bool:
     return root.tag == "{http://www.w3.org/2001/10/synthesis}speak"
 
 
+def _has_emojis(text: str) -> bool:
+    return any(emoji in text for emoji in SSML_EMOTIONS)
+
+
 def _collect_and_remove_emojis(text: str, collection: list[str] | None) -> str:
     """Remove emojis from the given string while collecting
     fragments with encountered emojis to the given list.
     If the collection argument is None, the collection step will be skipped.
     """
 
+    # Most text has no emojis, and substring search is far cheaper
+    # than running the regex over it.
+    if not _has_emojis(text):
+        return text
+
     def _repl(m, acc):
         if acc:
             acc.append(m.group(0))
@@ -722,11 +958,7 @@ def _collect_and_remove_emojis(text: str, collection: list[str] | None) -> str:
         else:
             return " "
 
-    text = re.sub(
-        rf"\s*[{''.join(SSML_EMOTIONS.keys())}]\s*\.*",
-        lambda m: _repl(m, collection),
-        text,
-    )
+    text = _EMOJI_SUB_RE.sub(lambda m: _repl(m, collection), text)
 
     return text
 
@@ -735,19 +967,24 @@ def _emojis_to_ssml_emotion_tags(text: str, lang: Language) -> str:
     def _wrap_into_emotion_tag(text: str, emotion: str):
         return f'<mstts:express-as style="{emotion}">' + text + "</mstts:express-as>"
 
-    pattern = rf"([{''.join(SSML_EMOTIONS.keys())}]\s*[.!?,;:]*)"
-    split_by_emojis = re.split(pattern, text)
-    text_with_emotion_tags = ""
-    # Iterate over pairs: substring and it's subsequent emoji fragment
-    for i in range(0, len(split_by_emojis) - 1, 2):
-        # Emoji fragment is dirty - it contains
-        # subsequent spaces and punctuation marks
-        emoji_fagment_dirty = split_by_emojis[i + 1]
-        substr = split_by_emojis[i].strip()
-
-        if substr == "":
-            continue
+    # Without emojis the whole text takes the default emotion.
+    if not _has_emojis(text):
+        return _wrap_into_emotion_tag(text.strip(), "calm") if text.strip() else ""
+
+    split_by_emojis = _EMOJI_SPLIT_RE.split(text)
+    # Pairs of a substring and it's subsequent emoji fragment.
+    # Emoji fragment is dirty - it contains subsequent spaces
+    # and punctuation marks.
+    fragments = [
+        (split_by_emojis[i].strip(), split_by_emojis[i + 1])
+        for i in range(0, len(split_by_emojis) - 1, 2)
+        if split_by_emojis[i].strip() != ""
+    ]
+    # Break all substrings into sentences at once.
+    substr_sentences = sentences_batch([substr for substr, _ in fragments], lang)
 
+    text_with_emotion_tags = ""
+    for (substr, emoji_fagment_dirty), _sentences in zip(fragments, substr_sentences):
         # Retrieve a clean emoji and punctuation marks
         emoji = emoji_fagment_dirty[0]
         punctuation_tail = emoji_fagment_dirty[1:].strip()
@@ -760,13 +997,11 @@ def _emojis_to_ssml_emotion_tags(text: str, lang: Language) -> str:
         # of inconvenient emoji positioning in a sentence relative
         # to surrounding punctuation.
         # TODO: improve this part - for now it's a crude fix.
-        if not re.fullmatch(r"[.?!]+", punctuation_tail) and not substr.endswith(
-            (".", "!", "?")
+        if not _PUNCT_TAIL_RE.fullmatch(punctuation_tail) and not substr.endswith(
+            _SENT_END
         ):
             punctuation_tail = "."
 
-        _sentences = sentences(substr, lang)
-
         # An encountered emoji affects only the last
         # sentence of the preceding substring
         affected_substr = _sentences[-1]
@@ -795,61 +1030,85 @@ def _emojis_to_ssml_emotion_tags(text: str, lang: Language) -> str:
     return text_with_emotion_tags
 
 
-def _wrap_in_ssml(
-    text: str, voice: str, speech_rate: float, lang: Language = "en-US"
-) -> str:
-    def _google():
-        decorated_text = "".join(
-            [
-                f"<s>{_collect_and_remove_emojis(sentence, collection=None)}</s>"
-                for sentence in split_sentences(text)
-            ]
-        )
+def _is_azure_voice(voice: str) -> bool:
+    # TODO (astaff, 20220906): Refactor this and remove guessing
+    # the provider from the name of their voice.
+    return voice.endswith("Neural")  # Assuming all azure voices end with Neural
 
-        result = (
-            '<speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" '
-            'xml:lang="{LANG}">'
-            '<voice name="{VOICE}"><prosody rate="{RATE:f}">{TEXT}</prosody></voice>'
-            "</speak>".format(
-                TEXT=decorated_text, VOICE=voice, RATE=speech_rate, LANG=lang
-            )
-        )
-        assert is_valid_ssml(result), f"text={decorated_text} result={result}"
-        return result
 
-    def _azure():
+_AZURE_SSML_PREFIX = (
+    '<speak xmlns="http://www.w3.org/2001/10/synthesis" xmlns:mstts="http://www.w3.org/2001/mstts" xmlns:emo="http://www.w3.org/2009/10/emotionml" xml:lang="{LANG}" version="1.0">'  # noqa: E501
+    '<voice name="{VOICE}"><prosody rate="{RATE}"><mstts:silence type="Sentenceboundary" value="100ms"/>'  # noqa: E501
+)
+_GOOGLE_SSML_PREFIX = (
+    '<speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" '
+    'xml:lang="{LANG}">'
+    '<voice name="{VOICE}"><prosody rate="{RATE}">'
+)
+_SSML_SUFFIX = "</prosody></voice></speak>"
+
+
+def _ssml_rate(voice: str, speech_rate: float) -> str:
+    """Value of the prosody rate attribute for `voice`."""
+    if _is_azure_voice(voice):
         rate_percent = (speech_rate - 1.0) * 100.0
         if rate_percent >= 0:
-            rate_str = f"+{rate_percent}%"
+            return f"+{rate_percent}%"
         else:
-            rate_str = f"{rate_percent}%"
-
-        result = (
-            '<speak xmlns="http://www.w3.org/2001/10/synthesis" xmlns:mstts="http://www.w3.org/2001/mstts" xmlns:emo="http://www.w3.org/2009/10/emotionml" xml:lang="{LANG}" version="1.0">'  # noqa: E501
-            '<voice name="{VOICE}"><prosody rate="{RATE}"><mstts:silence type="Sentenceboundary" value="100ms"/>{TEXT}</prosody></voice>'  # noqa: E501
-            "</speak>".format(
-                TEXT=_emojis_to_ssml_emotion_tags(text, lang),
-                VOICE=voice,
-                RATE=rate_str,
-                LANG=lang,
-            )
-        )
-        assert is_valid_ssml(result), f"text={text} result={result}"
-        return result
+            return f"{rate_percent}%"
+    else:
+        return f"{speech_rate:f}"
 
-    # TODO (astaff, 20220906): Refactor this and remove guessing
-    # the provider from the name of their voice.
-    if voice.endswith("Neural"):  # Assuming all azure voices end with Neural
-        return _azure()
+
+def _ssml_envelope(
+    voice: str, speech_rate: float, lang: Language = "en-US"
+) -> Tuple[str, str]:
+    """Opening and closing SSML markup that goes around the text for `voice`."""
+    template = _AZURE_SSML_PREFIX if _is_azure_voice(voice) else _GOOGLE_SSML_PREFIX
+    prefix = template.format(
+        VOICE=voice, RATE=_ssml_rate(voice, speech_rate), LANG=lang
+    )
+    return prefix, _SSML_SUFFIX
+
+
+@cache
+def _ssml_envelope_length(voice: str, lang: Language) -> int:
+    """Length of the SSML envelope for `voice` not counting the rate value."""
+    template = _AZURE_SSML_PREFIX if _is_azure_voice(voice) else _GOOGLE_SSML_PREFIX
+    return len(template.format(VOICE=voice, RATE="", LANG=lang)) + len(_SSML_SUFFIX)
+
+
+def _ssml_overhead(voice: str, speech_rate: float) -> int:
+    """Number of characters SSML markup adds around the text for `voice`."""
+    return _ssml_envelope_length(voice, "en-US") + len(_ssml_rate(voice, speech_rate))
+
+
+def _ssml_text(text: str, voice: str, lang: Language = "en-US") -> str:
+    """Convert text into SSML markup that goes inside the envelope for `voice`."""
+    if _is_azure_voice(voice):
+        return _emojis_to_ssml_emotion_tags(text, lang)
     else:
-        return _google()
+        _sentences = split_sentences(text)
+        if _has_emojis(text):
+            _sentences = [
+                _collect_and_remove_emojis(sentence, collection=None)
+                for sentence in _sentences
+            ]
+        return "".join([f"<s>{sentence}</s>" for sentence in _sentences])
+
+
+def _wrap_in_ssml(
+    text: str, voice: str, speech_rate: float, lang: Language = "en-US"
+) -> str:
+    prefix, suffix = _ssml_envelope(voice, speech_rate, lang)
+    return prefix + _ssml_text(text, voice, lang) + suffix
 
 
 def text_to_chunks(
     text: str, chunk_length: int, voice: str, speech_rate: float
 ) -> Sequence[str]:
-    inner = re.sub(r"#(\d+(\.\d+)?)#", r'<break time="\1s" />', text)
-    overhead = len(_wrap_in_ssml("", voice=voice, speech_rate=speech_rate))
+    inner = _BREAK_RE.sub(r'<break time="\1s" />', text)
+    overhead = _ssml_overhead(voice, speech_rate)
     sentence_overhead = len("<s></s>")
     return chunk(
         text=inner,
@@ -866,61 +1125,83 @@ async def _synthesize_text(
     output_dir: Path | str,
     cache_dir: str = os.path.join(os.path.expanduser("~"), ".cache/freespeech"),
     use_cache: bool = True,
+    chunk_semaphore: asyncio.Semaphore | None = None,
+    elevenlabs_voices: dict[str, str] | None = None,
 ) -> Tuple[Path, Voice, bool]:
     def cache_result(
         output_file: str, synthesized_path: str, voice_path: str, voice: Voice
     ) -> None:
-        shutil.copyfile(output_file, synthesized_path)
-        with open(voice_path, "w") as voice_cache:
-            voice_cache.write(
-                json.dumps(
-                    {
-                        "speech_rate": voice.speech_rate,
-                        "character": voice.character,
-                        "pitch": voice.pitch,
-                    }
-                )
+        # Write the voice first and link the audio last, so that a concurrent
+        # event that finds the audio also finds a complete voice next to it.
+        # Both are atomically replaced, as they might be another event's
+        # output written concurrently.
+        tmp_voice_path = f"{voice_path}.{uuid4()}"
+        Path(tmp_voice_path).write_text(
+            json.dumps(
+                {
+                    "speech_rate": voice.speech_rate,
+                    "character": voice.character,
+                    "pitch": voice.pitch,
+                }
             )
+        )
+        os.replace(tmp_voice_path, voice_path)
+
+        # Hard link to avoid copying the audio and fall back to a copy
+        # if the cache is on another device.
+        tmp_path = f"{synthesized_path}.{uuid4()}"
+        try:
+            os.link(output_file, tmp_path)
+        except OSError:
+            shutil.copyfile(output_file, tmp_path)
+        os.replace(tmp_path, synthesized_path)
         obj.rotate_cache(cache_dir)
 
     synthesized_hash = hash.obj((text, duration_ms, voice, lang))
     synthesized_path = f"{cache_dir}/{synthesized_hash}.wav"
     voice_path = f"{cache_dir}/{synthesized_hash}-voice.json"
 
-    if not os.path.exists(cache_dir):
-        os.makedirs(cache_dir)
+    os.makedirs(cache_dir, exist_ok=True)
 
     if use_cache:
-        if os.path.exists(voice_path) and os.path.exists(synthesized_path):
-            with open(voice_path, "r") as cached_voice:
-                voice = Voice(**json.loads(cached_voice.read()))
+        try:
+            os.stat(synthesized_path)
+            cached_voice = await asyncio.to_thread(Path(voice_path).read_text)
+        except FileNotFoundError:
+            pass
+        else:
+            voice = Voice(**json.loads(cached_voice))
             return Path(synthesized_path), voice, True
 
     character = voice.character
-    if character not in VOICES:
-        raise ValueError(
-            f"Unsupported voice: {character}\n" f"Supported voices: {VOICES}"
-        )
+    provider_and_voice = _VOICES_FLAT.get((character, lang))
 
-    if lang not in VOICES[character]:
-        raise ValueError(f"Unsupported lang {lang} for {voice}\n")
+    if not provider_and_voice:
+        if character not in VOICES:
+            raise ValueError(
+                f"Unsupported voice: {character}\n" f"Supported voices: {VOICES}"
+            )
 
-    provider_and_voice = VOICES[character][lang]
+        if lang not in VOICES[character]:
+            raise ValueError(f"Unsupported lang {lang} for {voice}\n")
 
-    if not provider_and_voice:
         raise ValueError(f"No provider for {voice} in {lang}")
 
     provider, provider_voice = provider_and_voice
     match provider:
-        case "Google":
-            all_voices = supported_google_voices()
-        case "Azure":
-            all_voices = await supported_azure_voices()
+        case "Google" | "Azure":
+            pass
         case "ElevenLabs":
             speech = await elevenlabs.synthesize(
-                text, voice.character, voice.speech_rate, Path(output_dir)
+                text,
+                voice.character,
+                voice.speech_rate,
+                Path(output_dir),
+                voices=elevenlabs_voices,
+            )
+            await asyncio.to_thread(
+                cache_result, speech.as_posix(), synthesized_path, voice_path, voice
             )
-            cache_result(speech.as_posix(), synthesized_path, voice_path, voice)
             return speech, voice, False
         case "Deepgram":
             raise ValueError("Deepgram can not be used as TTS provider")
@@ -936,45 +1217,92 @@ async def _synthesize_text(
 
     # eyeballing duration?
 
-    if provider_voice not in all_voices or lang not in all_voices[provider_voice]:
-        raise ValueError(
-            (
-                f"{provider} Speech Synthesis API "
-                "doesn't support {lang} for voice {voice}\n"
-                f"Supported values: {all_voices}"
-            )
-        )
+    # A voice the provider has retired fails here with a helpful error.
+    # Lists of voices are cached in memory and on disk, so this is mostly
+    # a lookup. It can be turned off with FREESPEECH_VALIDATE_TTS_VOICES=0.
+    if env.is_tts_voice_check_enabled():
+        if provider == "Google":
+            # The first call makes a blocking gRPC request, keep it off the loop.
+            all_voices = await asyncio.to_thread(supported_google_voices)
+        else:
+            all_voices = await supported_azure_voices()
 
-    async def _synthesize_step(rate: float, retries: int | None) -> Tuple[Path, float]:
-        if retries is not None and retries < 0:
-            raise RuntimeError(
+        if provider_voice not in all_voices or lang not in all_voices[provider_voice]:
+            raise ValueError(
                 (
-                    "Unable to converge while adjusting speaking rate "
-                    f"after {SYNTHESIS_RETRIES} attempts."
-                    f"text={text} duration={duration_ms}"
+                    f"{provider} Speech Synthesis API "
+                    "doesn't support {lang} for voice {voice}\n"
+                    f"Supported values: {all_voices}"
                 )
             )
 
-        if duration_ms is not None:
-            if rate < SPEECH_RATE_MINIMUM:
-                logger.warning(f"Below SPEECH_RATE_MINIMUM: text={text} rate={rate}")
-                return await _synthesize_step(SPEECH_RATE_MINIMUM, retries=None)
+    # Audio for individual SSML chunks is cached too, so that editing
+    # a sentence only re-synthesizes the chunks it ends up in. They are kept
+    # next to `cache_dir` and rotated separately.
+    chunks_cache_dir = f"{cache_dir}-chunks"
+
+    def chunk_path(ssml_phrase: str) -> str:
+        chunk_hash = hash.obj((provider_voice, voice.pitch, lang, ssml_phrase))
+        return f"{chunks_cache_dir}/{chunk_hash}.wav"
 
-            if rate > SPEECH_RATE_MAXIMUM:
-                logger.warning(f"Above SPEECH_RATE_MAXIMUM: text={text} rate={rate}")
-                return await _synthesize_step(SPEECH_RATE_MAXIMUM, retries=None)
+    def read_cached_chunks(ssml_phrases: Sequence[str]) -> Dict[str, bytes]:
+        cached_chunks = {}
+        for ssml_phrase in ssml_phrases:
+            try:
+                cached_chunks[ssml_phrase] = Path(chunk_path(ssml_phrase)).read_bytes()
+            except FileNotFoundError:
+                pass
+        return cached_chunks
+
+    def cache_chunks(chunks: Dict[str, bytes]) -> None:
+        os.makedirs(chunks_cache_dir, exist_ok=True)
+        for ssml_phrase, audio in chunks.items():
+            if audio:
+                # Events are synthesized concurrently and may share chunks,
+                # so never expose a partially written file.
+                path = chunk_path(ssml_phrase)
+                tmp_path = f"{path}.{uuid4()}"
+                Path(tmp_path).write_bytes(audio)
+                os.replace(tmp_path, path)
+        obj.rotate_cache(chunks_cache_dir)
+
+    # Request parameters shared by all Google chunks and steps.
+    google_voice_params = google_tts.VoiceSelectionParams(language_code=lang)
+    google_audio_config = google_tts.AudioConfig(
+        audio_encoding=google_tts.AudioEncoding.LINEAR16,
+        pitch=voice.pitch,
+    )
 
-        def _google_api_call(ssml_phrase: str) -> bytes:
-            client = google_tts.TextToSpeechClient()
-            result = client.synthesize_speech(
+    # SSML for the text of each chunk doesn't depend on the speech rate,
+    # so it is built once for all steps.
+    ssml_texts = [
+        _ssml_text(phrase, voice=provider_voice)
+        for phrase in chunks_with_breaks_expanded
+    ]
+    # Parsing the markup is expensive, so it is only validated on request.
+    if env.is_ssml_check_enabled():
+        prefix, suffix = _ssml_envelope(provider_voice, speech_rate=voice.speech_rate)
+        assert all(
+            is_valid_ssml(prefix + ssml_text + suffix) for ssml_text in ssml_texts
+        ), f"ssml_texts={ssml_texts}"
+
+    # Chunks synthesized by the last step. Only the final speech rate is cached.
+    new_chunks: Dict[str, bytes] = {}
+
+    # Long texts make a lot of chunks, don't send them all at once.
+    # Callers synthesizing several texts pass one semaphore shared by all.
+    if chunk_semaphore is None:
+        chunk_semaphore = asyncio.Semaphore(SYNTHESIS_CHUNK_CONCURRENCY)
+
+    async def _synthesize_step(rate: float) -> Path:
+        nonlocal new_chunks
+
+        async def _google_api_call(ssml_phrase: str) -> bytes:
+            client = _google_tts_async_client()
+            result = await client.synthesize_speech(
                 input=google_tts.SynthesisInput(ssml=ssml_phrase),
-                voice=google_tts.VoiceSelectionParams(
-                    language_code=lang,
-                ),
-                audio_config=google_tts.AudioConfig(
-                    audio_encoding=google_tts.AudioEncoding.LINEAR16,
-                    pitch=voice.pitch,
-                ),
+                voice=google_voice_params,
+                audio_config=google_audio_config,
             )
             return result.audio_content
 
@@ -986,34 +1314,48 @@ async def _synthesize_text(
                 "Ocp-Apim-Subscription-Key": azure_key,
             }
             url = f"https://{azure_region}.tts.speech.microsoft.com"
-            async with aiohttp.ClientSession(url, headers=headers) as session:
-                async with session.post(
-                    "/cognitiveservices/v1", data=ssml_phrase
-                ) as response:
-                    if not response.ok:
-                        raise RuntimeError(str(response))
-                    return await response.read()
+            session = _get_azure_session(azure_region)
+            async with session.post(
+                f"{url}/cognitiveservices/v1", headers=headers, data=ssml_phrase
+            ) as response:
+                if not response.ok:
+                    raise RuntimeError(str(response))
+                return await response.read()
+
+        # Only the rate in the envelope changes between steps.
+        prefix, suffix = _ssml_envelope(provider_voice, speech_rate=rate)
+        ssml_phrases = [prefix + ssml_text + suffix for ssml_text in ssml_texts]
+
+        # Repeated phrases (e.g. "Thank you.") are synthesized only once.
+        unique_phrases = list(dict.fromkeys(ssml_phrases))
+        cached_chunks = (
+            await asyncio.to_thread(read_cached_chunks, unique_phrases)
+            if use_cache
+            else {}
+        )
+        missing_phrases = [
+            ssml_phrase
+            for ssml_phrase in unique_phrases
+            if ssml_phrase not in cached_chunks
+        ]
+
+        async def _bounded(api_call, ssml_phrase: str) -> bytes:
+            async with chunk_semaphore:
+                return await api_call(ssml_phrase)
 
         match provider:
             case "Azure":
-                responses = await asyncio.gather(
+                missing_responses = await asyncio.gather(
                     *[
-                        _azure_api_call(
-                            _wrap_in_ssml(chunk, voice=provider_voice, speech_rate=rate)
-                        )
-                        for chunk in chunks_with_breaks_expanded
+                        _bounded(_azure_api_call, ssml_phrase)
+                        for ssml_phrase in missing_phrases
                     ]
                 )
             case "Google":
-                responses = await asyncio.gather(
+                missing_responses = await asyncio.gather(
                     *[
-                        concurrency.run_in_thread_pool(
-                            _google_api_call,
-                            _wrap_in_ssml(
-                                phrase, voice=provider_voice, speech_rate=rate
-                            ),
-                        )
-                        for phrase in chunks_with_breaks_expanded
+                        _bounded(_google_api_call, ssml_phrase)
+                        for ssml_phrase in missing_phrases
                     ]
                 )
             case "ElevenLabs":
@@ -1023,6 +1365,10 @@ async def _synthesize_text(
             case never:
                 assert_never(never)
 
+        new_chunks = dict(zip(missing_phrases, missing_responses))
+        synthesized = {**cached_chunks, **new_chunks}
+        responses = [synthesized[ssml_phrase] for ssml_phrase in ssml_phrases]
+
         def is_valid_file(file: str) -> bool:
             try:
                 media.probe(file)
@@ -1030,50 +1376,94 @@ async def _synthesize_text(
             except Exception:
                 return False
 
-        with TemporaryDirectory() as tmp_dir:
-            files = [f"{media.new_file(tmp_dir)}.wav" for _ in responses]
-            for file, response in zip(files, responses):
-                with open(file, "wb") as fd:
-                    fd.write(response)
+        async def concat_files(responses: Sequence[bytes]) -> Path | None:
+            with TemporaryDirectory() as tmp_dir:
+                files = [f"{media.new_file(tmp_dir)}.wav" for _ in responses]
 
-            # filter out invalid files (e.g. empty files)
-            files = [file for file in files if is_valid_file(file)]
+                def write_files() -> None:
+                    for file, response in zip(files, responses):
+                        Path(file).write_bytes(response)
 
-            if files:
-                audio_file = await media.concat(files, output_dir)
-            else:
-                # fallback to a silent audio file
-                audio_file = Path(f"{media.new_file(output_dir)}.wav")
-                fd = pydub.AudioSegment.silent(duration=1, frame_rate=44100).export(
-                    audio_file, format="wav"
+                await asyncio.to_thread(write_files)
+
+                # filter out invalid files (e.g. empty files)
+                files = [file for file in files if is_valid_file(file)]
+
+                return await media.concat_wav(files, output_dir) if files else None
+
+        # Chunks are normally PCM WAV, so they are joined in memory
+        # without writing each one to a file. Empty ones are skipped.
+        if all(not response or _is_pcm_wav(response) for response in responses):
+            wav_responses = [response for response in responses if response]
+            audio_file = (
+                await media.concat_wav(wav_responses, output_dir)
+                if wav_responses
+                else None
+            )
+        else:
+            audio_file = await concat_files(responses)
+
+        if audio_file is None:
+            # fallback to a silent audio file
+            audio_file = Path(f"{media.new_file(output_dir)}.wav")
+            fd = pydub.AudioSegment.silent(duration=1, frame_rate=44100).export(
+                audio_file, format="wav"
+            )
+            fd.close()  # type: ignore
+
+        return audio_file
+
+    # Adjust speaking rate until the audio fits the duration.
+    speech_rate = voice.speech_rate
+    retries: int | None = SYNTHESIS_RETRIES
+    while True:
+        if retries is not None and retries < 0:
+            raise RuntimeError(
+                (
+                    "Unable to converge while adjusting speaking rate "
+                    f"after {SYNTHESIS_RETRIES} attempts."
+                    f"text={text} duration={duration_ms}"
+                )
+            )
+
+        if duration_ms is not None:
+            if speech_rate < SPEECH_RATE_MINIMUM:
+                logger.warning(
+                    f"Below SPEECH_RATE_MINIMUM: text={text} rate={speech_rate}"
+                )
+                speech_rate, retries = SPEECH_RATE_MINIMUM, None
+            elif speech_rate > SPEECH_RATE_MAXIMUM:
+                logger.warning(
+                    f"Above SPEECH_RATE_MAXIMUM: text={text} rate={speech_rate}"
                 )
-                fd.close()  # type: ignore
+                speech_rate, retries = SPEECH_RATE_MAXIMUM, None
 
-        (audio, *_), _ = media.probe(audio_file)
-        assert isinstance(audio, Audio)
+        output_file = await _synthesize_step(speech_rate)
+
+        # Reads the WAV header and only falls back to ffprobe for other formats.
+        audio_duration_ms = await asyncio.to_thread(_audio_duration_ms, output_file)
 
         if (
             duration_ms is None
             or retries is None
-            or abs(audio.duration_ms - duration_ms) < SYNTHESIS_ERROR_MS
+            or abs(audio_duration_ms - duration_ms) < SYNTHESIS_ERROR_MS
         ):
-            return Path(audio_file), rate
-        else:
-            logger.warning(
-                f"retrying delta={audio.duration_ms - duration_ms} rate={rate}"
-            )
-            rate *= audio.duration_ms / duration_ms
-            return await _synthesize_step(rate, retries - 1)
+            break
 
-    output_file, speech_rate = await _synthesize_step(
-        rate=voice.speech_rate, retries=SYNTHESIS_RETRIES
-    )
+        logger.warning(
+            f"retrying delta={audio_duration_ms - duration_ms} rate={speech_rate}"
+        )
+        speech_rate *= audio_duration_ms / duration_ms
+        retries -= 1
 
     new_voice = Voice(
         speech_rate=speech_rate, character=voice.character, pitch=voice.pitch
     )
 
-    cache_result(output_file.as_posix(), synthesized_path, voice_path, new_voice)
+    await asyncio.to_thread(
+        cache_result, output_file.as_posix(), synthesized_path, voice_path, new_voice
+    )
+    await asyncio.to_thread(cache_chunks, new_chunks)
 
     return output_file, new_voice, False
 
@@ -1086,6 +1476,8 @@ async def synthesize_text(
     output_dir: Path | str,
     cache_dir: str = os.path.join(os.path.expanduser("~"), ".cache/freespeech"),
     use_cache: bool = True,
+    chunk_semaphore: asyncio.Semaphore | None = None,
+    elevenlabs_voices: dict[str, str] | None = None,
 ) -> Tuple[Path, Voice, bool]:
     for retry in range(API_RETRIES):
         try:
@@ -1097,6 +1489,8 @@ async def synthesize_text(
                 output_dir,
                 cache_dir,
                 use_cache,
+                chunk_semaphore,
+                elevenlabs_voices,
             )
         except (
             ConnectionAbortedError,
@@ -1127,37 +1521,82 @@ async def synthesize_events(
         boolean indicating whether each event was retrieved from cached
         the cache."""
     output_dir = Path(output_dir)
+    semaphore = asyncio.Semaphore(SYNTHESIS_CONCURRENCY)
+    # Limits API requests for chunks of all events together.
+    chunk_semaphore = asyncio.Semaphore(SYNTHESIS_CHUNK_CONCURRENCY)
+    elevenlabs_semaphore = asyncio.Semaphore(ELEVENLABS_CONCURRENCY)
+
+    def _is_elevenlabs(voice: Voice) -> bool:
+        provider_and_voice = _VOICES_FLAT.get((voice.character, lang))
+        return provider_and_voice is not None and provider_and_voice[0] == "ElevenLabs"
+
+    # ElevenLabs voices are looked up once for all events.
+    elevenlabs_voices = (
+        await elevenlabs.get_voices()
+        if any(_is_elevenlabs(event.voice) for event in events)
+        else None
+    )
+
+    async def _synthesize_event(
+        text: str, duration_ms: int | None, voice: Voice
+    ) -> Tuple[Path, Voice, bool, int]:
+        async with elevenlabs_semaphore if _is_elevenlabs(voice) else semaphore:
+            clip, voice, cache_used = await synthesize_text(
+                text=text,
+                duration_ms=duration_ms,
+                voice=voice,
+                lang=lang,
+                output_dir=output_dir,
+                cache_dir=cache_dir,
+                use_cache=use_cache,
+                chunk_semaphore=chunk_semaphore,
+                elevenlabs_voices=elevenlabs_voices,
+            )
+            clip_duration_ms = await asyncio.to_thread(_audio_duration_ms, clip)
+        return clip, voice, cache_used, clip_duration_ms
+
+    # Identical events would all miss the cache if synthesized concurrently,
+    # so each of them is synthesized once.
+    keys = [
+        (" ".join(event.chunks), event.duration_ms, event.voice) for event in events
+    ]
+    tasks = {
+        key: asyncio.create_task(_synthesize_event(*key)) for key in dict.fromkeys(keys)
+    }
+    try:
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        raise
+
     current_time_ms = 0
     clips = []
     voices = []
     spans = []
 
     cache_hits = []
-    for event in events:
-        padding_ms = event.time_ms - current_time_ms
-        spans += [("blank", current_time_ms, event.time_ms)]
-        text = " ".join(event.chunks)
-        clip, voice, cache_used = await synthesize_text(
-            text=text,
-            duration_ms=event.duration_ms,
-            voice=event.voice,
-            lang=lang,
-            output_dir=output_dir,
-            cache_dir=cache_dir,
-            use_cache=use_cache,
-        )
-        cache_hits += [cache_used]
-        (audio, *_), _ = media.probe(clip)
-        assert isinstance(audio, Audio)
+    seen_keys = set()
+    for event, key in zip(events, keys):
+        clip, voice, cache_used, clip_duration_ms = tasks[key].result()
+        # Repeated events reuse the audio, as if they were read from the cache.
+        cache_used = cache_used or (use_cache and key in seen_keys)
+        seen_keys.add(key)
+
+        time_ms = event.time_ms
+        padding_ms = time_ms - current_time_ms
+        spans.append(("blank", current_time_ms, time_ms))
+        cache_hits.append(cache_used)
 
         if padding_ms < 0:
+            text = " ".join(event.chunks)
             logger.warning(f"Negative padding ({padding_ms}) in front of: {text}")
 
-        clips += [(padding_ms, clip)]
-        current_time_ms = event.time_ms + audio.duration_ms
-        spans += [("event", event.time_ms, current_time_ms)]
+        clips.append((padding_ms, clip))
+        current_time_ms = time_ms + clip_duration_ms
+        spans.append(("event", time_ms, current_time_ms))
 
-        voices += [voice]
+        voices.append(voice)
 
     if all(cache_hits):
         return await synthesize_events(
@@ -1212,39 +1651,42 @@ def normalize_speech(
 
     REMOVE_SYMBOLS = "\n"
 
+    # Most events are a single line of text already and are kept as is.
     scrubbed_events = [
-        replace(e, chunks=[remove_symbols(" ".join(e.chunks), REMOVE_SYMBOLS)])
+        e
+        if len(e.chunks) == 1 and REMOVE_SYMBOLS not in e.chunks[0]
+        else replace(e, chunks=[remove_symbols(" ".join(e.chunks), REMOVE_SYMBOLS)])
         for e in events
     ]
 
-    first_event, *events = scrubbed_events
-    acc = [first_event]
+    current, *events = scrubbed_events
+    # Every scrubbed event has exactly one chunk. The text of the event
+    # being extended is computed once, when it starts or absorbs another one.
+    current_text = current.chunks[0].strip()
+    acc = []
 
     for event in events:
-        last_event = acc.pop()
-        last_text = (" ".join(last_event.chunks)).strip()
-
-        if last_event.duration_ms is None or event.duration_ms is None:
-            acc += [last_event, event]
+        if (
+            current.duration_ms is None
+            or event.duration_ms is None
+            or event.time_ms - current.time_ms - current.duration_ms > gap_ms
+            or current.voice != event.voice
+            or (len(current_text) > length and is_sentence(current_text))
+        ):
+            acc.append(current)
+            current, current_text = event, event.chunks[0].strip()
             continue
 
-        gap = event.time_ms - last_event.time_ms - last_event.duration_ms
-
-        if gap > gap_ms:
-            acc += [last_event, event]
-        elif len(last_text) > length and is_sentence(last_text):
-            acc += [last_event, event]
-        elif last_event.voice != event.voice:
-            acc += [last_event, event]
-        else:
-            match method:
-                case "break_ends_sentence":
-                    acc += [concat_events(last_event, event, break_sentence=True)]
-                case "extract_breaks_from_sentence":
-                    raise NotImplementedError()
-                case never:
-                    assert_never(never)
+        match method:
+            case "break_ends_sentence":
+                current = concat_events(current, event, break_sentence=True)
+                current_text = current.chunks[0].strip()
+            case "extract_breaks_from_sentence":
+                raise NotImplementedError()
+            case never:
+                assert_never(never)
 
+    acc.append(current)
     return acc
 
 
@@ -1253,39 +1695,29 @@ def fix_sentence_boundaries(
     phrase_start_ms: int,
     phrase_finish_ms: int,
 ) -> list[tuple[str, tuple[int, int]]]:
-    def _reducer(
-        acc: list[tuple[str, tuple[int, int | None]]],
-        next_sentence: tuple[str, tuple[int, int] | None],
-    ) -> list[tuple[str, tuple[int, int | None]]]:
-        sentence, span = next_sentence
+    fixed_sentences: list[tuple[str, tuple[int, int | None]]] = []
+    for sentence, span in sentences:
         if span is None:
-            if len(acc) == 0:
-                return [(sentence, (phrase_start_ms, None))]
+            if not fixed_sentences:
+                fixed_sentences.append((sentence, (phrase_start_ms, None)))
             else:
-                prev_sentence, (prev_start, prev_finish) = acc[-1]
-                return acc[:-1] + [(prev_sentence + " " + sentence, (prev_start, None))]
+                prev_sentence, (prev_start, _) = fixed_sentences[-1]
+                fixed_sentences[-1] = (
+                    prev_sentence + " " + sentence,
+                    (prev_start, None),
+                )
+        elif not fixed_sentences or fixed_sentences[-1][1][1] is not None:
+            fixed_sentences.append((sentence, span))
         else:
-            if len(acc) == 0:
-                return [(sentence, span)]
-            else:
-                prev_sentence, (prev_start, prev_finish) = acc[-1]
-                if prev_finish is None:
-                    return acc[:-1] + [
-                        (prev_sentence + " " + sentence, (prev_start, span[1]))
-                    ]
-                else:
-                    return acc + [(sentence, span)]
-
-    fixed_sentences: list[tuple[str, tuple[int, int | None]]] = reduce(
-        _reducer, sentences, []
-    )
+            prev_sentence, (prev_start, _) = fixed_sentences[-1]
+            fixed_sentences[-1] = (
+                prev_sentence + " " + sentence,
+                (prev_start, span[1]),
+            )
 
-    if len(fixed_sentences) > 0:
-        last_sentence, (last_start, last_finish) = fixed_sentences.pop()
-        if last_finish is None:
-            fixed_sentences += [(last_sentence, (last_start, phrase_finish_ms))]
-        else:
-            fixed_sentences += [(last_sentence, (last_start, last_finish))]
+    if fixed_sentences and fixed_sentences[-1][1][1] is None:
+        last_sentence, (last_start, _) = fixed_sentences[-1]
+        fixed_sentences[-1] = (last_sentence, (last_start, phrase_finish_ms))
 
     for _, (_, finish_ms) in fixed_sentences:
         assert finish_ms is not None, "finish_ms is None"
@@ -1317,41 +1749,45 @@ def break_phrase(
     # reduce each word in text and words down to lemmas to avoid
     # mismatches due to effects of ASR's language model.
     _sentences = sentences(text, lang)
+    # ASR words repeat a lot, so lemmatize each distinct one only once.
+    unique_words = list(dict.fromkeys(word for word, *_ in words))
+    # Lemmatize sentences and words in a single pass through the pipeline.
+    all_lemmas = lemmas_batch([*_sentences, *unique_words], lang)
     display_tokens = [
         (lemma.lower(), num)
-        for num, sentence in enumerate(_sentences)
-        for lemma in lemmas(sentence, lang)
+        for num, sentence_lemmas in enumerate(all_lemmas[: len(_sentences)])
+        for lemma in sentence_lemmas
     ]
+    word_lemmas = dict(zip(unique_words, all_lemmas[len(_sentences) :]))
     lexical_tokens = [
         (lemma.lower(), start, duration)
         for word, start, duration in words
-        for lemma in lemmas(word, lang)
+        for lemma in word_lemmas[word]
     ]
 
-    # Find the longest common sequences between lemmas in text
+    # Find the longest common subsequence between lemmas in text
     # and lemmatized words.
-    matcher = difflib.SequenceMatcher(
-        a=[token for token, *_ in display_tokens],
-        b=[token for token, *_ in lexical_tokens],
-        autojunk=False,
+    opcodes = Indel.opcodes(
+        [token for token, *_ in display_tokens],
+        [token for token, *_ in lexical_tokens],
     )
     matches = [
         (num, (int(start), int(start) + int(duration)))
-        for i, j, n in matcher.get_matching_blocks()
+        for tag, i1, i2, j1, j2 in opcodes
+        if tag == "equal"
         for (_, num), (_, start, duration) in zip(
-            display_tokens[i : i + n], lexical_tokens[j : j + n]
+            display_tokens[i1:i2], lexical_tokens[j1:j2]
         )
     ]
 
     # Group matches by sentence number. The first and the last item
     # in the group will represent the first and last overlaps with the timed words.
-    sentence_timings = {
-        num: (start := timings[0][0], timings[-1][1] - start)
-        for num, timings in [
-            (num, [(start, finish) for _, (start, finish) in timings])
-            for num, timings in groupby(matches, key=lambda a: a[0])
-        ]
-    }
+    sentence_timings = {}
+    for num, group in groupby(matches, key=itemgetter(0)):
+        _, (start, finish) = next(group)
+        for _, (_, last_finish) in group:
+            finish = last_finish
+        sentence_timings[num] = (start, finish - start)
 
     # If timing information is missing for a sentence, use None
     res = [
@@ -1372,27 +1808,32 @@ def break_phrase(
 
 def restore_full_sentences(events: list[Event]) -> list[Event]:
     """Join events to ensure no sentences are split across events."""
-    res: list[Event] = []
+    # Events are accumulated along with their joined text,
+    # so the text of a merged event is never re-joined.
+    res: list[tuple[Event, str]] = []
     for event in events:
+        event_text = " ".join(event.chunks).strip()
         if not res:
-            res.append(event)
+            res.append((event, event_text))
             continue
 
-        prev_event = res.pop()
-        prev_event_text = " ".join(prev_event.chunks).strip()
-        event_text = " ".join(event.chunks).strip()
-        if any(prev_event_text.endswith(p) for p in (".", "!", "?")):
-            res.append(prev_event)
-            res.append(event)
+        prev_event, prev_event_text = res.pop()
+        if prev_event_text.endswith(_SENT_END):
+            res.append((prev_event, prev_event_text))
+            res.append((event, event_text))
         else:
             assert prev_event.duration_ms is not None
+            text = prev_event_text + " " + event_text
             res.append(
-                replace(
-                    prev_event,
-                    chunks=[prev_event_text + " " + event_text],
-                    duration_ms=prev_event.duration_ms + event.duration_ms
-                    if event.duration_ms is not None
-                    else None,
+                (
+                    replace(
+                        prev_event,
+                        chunks=[text],
+                        duration_ms=prev_event.duration_ms + event.duration_ms
+                        if event.duration_ms is not None
+                        else None,
+                    ),
+                    text.strip(),
                 )
             )
-    return res
+    return [event for event, _ in res]
@@ -41,8 +41,8 @@ def rotate_cache(cache_dir: str) -> None:
             key=os.path.getctime,
             reverse=True,
         )
-        while cache_size > ROTATED_CACHE_SIZE:
-            for _ in range(2):
+        while cache_size > ROTATED_CACHE_SIZE and file_paths:
+            for _ in range(min(2, len(file_paths))):
                 oldest_file = file_paths.pop()
                 cache_size -= get_size(oldest_file)
                 os.remove(oldest_file)
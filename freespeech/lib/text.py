@@ -3,8 +3,6 @@ import re
 from itertools import zip_longest
 from typing import Iterator, Sequence
 
-import spacy
-
 from freespeech.types import Language, assert_never
 
 # Apply simple heuristics to determine if a string is a sentence
@@ -14,6 +12,10 @@ LANGUAGES_WITHOUT_SPACY_SUPPORT = ("tr-TR", "ar-SA", "et-EE")
 
 @functools.cache
 def _nlp(lang: Language):
+    # Importing spacy takes about half a second, so only pay for it
+    # when a model is actually needed and not on every import of this module.
+    import spacy
+
     match lang:
         case "en-US":
             nlp = spacy.load("en_core_web_sm")
@@ -55,7 +57,7 @@ def is_sentence(s: str) -> bool:
     # TODO astaff: consider using text processing libraries like spacy
     # as we keep introducing stuff like this.
     s = s.strip()
-    return s.endswith(".") or s.endswith("!") or s.endswith("?")
+    return s.endswith((".", "!", "?"))
 
 
 def capitalize_sentence(s: str):
@@ -159,8 +161,12 @@ def chunk_raw(s: str, length: int) -> Sequence[str]:
 
 
 def remove_symbols(s: str, symbols: str) -> str:
-    t = str.maketrans(s, s, symbols)
-    return str.translate(s, t)
+    return str.translate(s, _removal_table(symbols))
+
+
+@functools.cache
+def _removal_table(symbols: str) -> dict[int, int | None]:
+    return str.maketrans("", "", symbols)
 
 
 def sentences(s: str, lang: Language) -> Sequence[str]:
@@ -174,12 +180,32 @@ def sentences(s: str, lang: Language) -> Sequence[str]:
         return split_sentences(s)
 
     nlp = _nlp(lang)
-    doc = nlp(s)
     senter = nlp.get_pipe("senter")
-    sentences = [span.text for span in senter(doc).sents]
+    return _sentences(senter(nlp(s)))
+
+
+def sentences_batch(texts: Sequence[str], lang: Language) -> Sequence[Sequence[str]]:
+    """Break each string into sentences running the pipeline once for all of them.
+    Args:
+        texts: input strings.
+    Returns:
+        Sequence of sentences for each string in `texts`.
+    """
+    if not texts:
+        return []
+
+    if lang in LANGUAGES_WITHOUT_SPACY_SUPPORT:
+        return [split_sentences(s) for s in texts]
+
+    nlp = _nlp(lang)
+    senter = nlp.get_pipe("senter")
+    return [_sentences(senter(doc)) for doc in nlp.pipe(texts, batch_size=64)]
+
+
+def _sentences(doc) -> Sequence[str]:
     return [
         sentence
-        for sentence in sentences
+        for sentence in (span.text for span in doc.sents)
         # We want to remove artifacts of the sentence splitter.
         # For example in fr-FR "Et zéro." produces ["Et zéro", "."]
         if sentence not in ("", " ", "!", ".", "?")
@@ -201,6 +227,25 @@ def lemmas(s: str, lang: Language) -> Sequence[str]:
     return [token.lemma_ for token in lemmatizer(nlp(s))]
 
 
+def lemmas_batch(texts: Sequence[str], lang: Language) -> Sequence[Sequence[str]]:
+    """Break each string into lemmas running the pipeline once for all of them.
+    Args:
+        texts: input strings.
+    Returns:
+        Sequence of lemmas for each string in `texts`.
+    """
+    if lang in LANGUAGES_WITHOUT_SPACY_SUPPORT:
+        return [[lemma for lemma in s.split() if lemma] for s in texts]
+
+    nlp = _nlp(lang)
+    lemmatizer = nlp.get_pipe("lemmatizer")
+    # Lemmatizers only rely on tags, so skip the most expensive components.
+    return [
+        [token.lemma_ for token in lemmatizer(doc)]
+        for doc in nlp.pipe(texts, batch_size=64, disable=["parser", "ner"])
+    ]
+
+
 def has_text(
     s: str,
 ) -> bool:
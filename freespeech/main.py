@@ -1,8 +1,24 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
 
 from freespeech.api import synthesize, transcribe, transcript, translate
+from freespeech.lib import speech
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Don't hold up the startup, requests can be served while connecting.
+    warm_up = asyncio.create_task(speech.warm_up())
+    yield
+    warm_up.cancel()
+    with suppress(asyncio.CancelledError):
+        await warm_up
+    await speech.close_azure_sessions()
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 
 app.include_router(synthesize.router)
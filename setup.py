@@ -66,6 +66,7 @@ setup(
         "pydantic",
         "pytz",
         "pydub",
+        "rapidfuzz",
         "requests",
         "soundfile",
         "spacy==3.7.0",
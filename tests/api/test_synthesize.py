@@ -8,6 +8,8 @@ from freespeech.lib import hash, media, speech
 from freespeech.lib.storage import obj
 from freespeech.types import Event, Settings, Transcript, Voice
 
+pytestmark = pytest.mark.usefixtures("close_azure_sessions")
+
 AUDIO_BLANK = Path("tests/lib/data/ask/audio-blank-blanked.wav")
 AUDIO_BLANK_SYNTHESIZED = Path("tests/lib/data/ask/audio-blank-synthesized.wav")
 AUDIO_FILL = Path("tests/lib/data/ask/audio-fill-filled.wav")
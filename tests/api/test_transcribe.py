@@ -11,6 +11,8 @@ from freespeech.types import (
     is_speech_to_text_backend,
 )
 
+pytestmark = pytest.mark.usefixtures("close_azure_sessions")
+
 
 @pytest.mark.asyncio
 async def test_load_subtitles() -> None:
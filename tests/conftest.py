@@ -3,6 +3,7 @@ import logging.config
 from dataclasses import dataclass
 
 import pytest
+import pytest_asyncio
 
 LOGGING_CONFIG = {
     "version": 1,
@@ -39,3 +40,15 @@ class Const:
 @pytest.fixture
 def const():
     return Const
+
+
+@pytest_asyncio.fixture
+async def close_azure_sessions():
+    """Close Azure sessions pooled by a test before its event loop is closed.
+
+    Requested by modules that use Azure, so the others don't import speech.
+    """
+    from freespeech.lib import speech
+
+    yield
+    await speech.close_azure_sessions()
@@ -1,3 +1,6 @@
+import wave
+from pathlib import Path
+
 import pytest
 
 from freespeech.lib import hash, media, speech
@@ -49,6 +52,33 @@ async def test_concat(tmp_path):
     assert audio.duration_ms == 5 * original_audio.duration_ms + epsilon
 
 
+@pytest.mark.asyncio
+async def test_concat_wav(tmp_path):
+    clips = [AUDIO_RU, AUDIO_EN, AUDIO_RU]
+    output = await media.concat_wav(clips, tmp_path)
+
+    with wave.open(str(output), "rb") as result:
+        frames = result.readframes(result.getnframes())
+
+    expected = b""
+    for clip in clips:
+        with wave.open(clip, "rb") as source:
+            assert source.getparams()[:3] == result.getparams()[:3]
+            expected += source.readframes(source.getnframes())
+
+    assert frames == expected
+
+    in_memory = [Path(clip).read_bytes() for clip in clips]
+    output = await media.concat_wav(in_memory, tmp_path)
+    with wave.open(str(output), "rb") as result:
+        assert result.readframes(result.getnframes()) == expected
+
+
+def test_wav_duration_ms():
+    assert media.wav_duration_ms(AUDIO_RU) == 3221
+    assert media.wav_duration_ms(AUDIO_POTATO) is None
+
+
 @pytest.mark.asyncio
 async def test_mix(tmp_path):
     files = (AUDIO_RU, AUDIO_EN)
@@ -1,7 +1,12 @@
+import asyncio
+import io
 import json
 import os
+import shutil
 import time
+import wave
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Sequence, get_args
 
 import pytest
@@ -9,6 +14,8 @@ import pytest
 from freespeech.lib import elevenlabs, hash, media, speech
 from freespeech.types import Character, Event, Language, Voice, assert_never
 
+pytestmark = pytest.mark.usefixtures("close_azure_sessions")
+
 AUDIO_EN_LOCAL = Path("tests/lib/data/media/en-US-mono.wav")
 AUDIO_EN_GS = "gs://freespeech-tests/test_speech/en-US-mono.wav"
 
@@ -792,6 +799,27 @@ def test_break_phrase_missing_sentence():
     ]
 
 
+def test_break_phrase_alignment():
+    # tr-TR doesn't need an nlp model: sentences and lemmas are split
+    # on punctuation and spaces, which isolates the alignment itself.
+    text = "Merhaba dünya. Bugün hava çok güzel! Yarın görüşürüz."
+    words = [
+        ("merhaba", 0, 400),
+        ("dünya.", 400, 500),
+        ("bugün", 1200, 300),
+        ("hava", 1500, 300),
+        ("cok", 1800, 200),  # misrecognized word
+        ("güzel!", 2000, 400),
+        ("yarın", 3000, 300),
+        ("görüşürüz.", 3300, 700),
+    ]
+    assert speech.break_phrase(text, words, lang="tr-TR") == [
+        ("Merhaba dünya. ", 0, 900),
+        ("Bugün hava çok güzel!", 1200, 1200),
+        (" Yarın görüşürüz.", 3000, 1000),
+    ]
+
+
 def test_fix_sentence_boundaries():
     middle_is_none = [
         ("Hello world", (0, 1000)),
@@ -920,7 +948,11 @@ async def test_recaching(tmp_path) -> None:
         events=events, lang="en-US", output_dir=tmp_path, cache_dir=cache_dir
     )
 
-    dummy_voice = f"{cache_dir}/{os.listdir(cache_dir)[0]}"  # will always be voice
+    dummy_voice = next(
+        f"{cache_dir}/{file}"
+        for file in os.listdir(cache_dir)
+        if file.endswith("-voice.json")
+    )
     dummy_contents = json.dumps(
         {
             "speech_rate": 1.1,
@@ -941,3 +973,149 @@ async def test_recaching(tmp_path) -> None:
 
     with open(dummy_voice, "r") as fd:
         assert fd.read() != dummy_contents
+
+
+@pytest.fixture
+def fake_google_tts(monkeypatch):
+    """Replace Google TTS client with the one counting its calls."""
+    with io.BytesIO() as buffer:
+        with wave.open(buffer, "wb") as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(44100)
+            wav_file.writeframes(bytes(44100))
+        wav = buffer.getvalue()
+
+    class FakeClient:
+        calls = 0
+
+        async def synthesize_speech(self, **kwargs):
+            FakeClient.calls += 1
+            return SimpleNamespace(audio_content=wav)
+
+    monkeypatch.setattr(speech, "_google_tts_async_client", FakeClient)
+    monkeypatch.setattr(
+        speech, "supported_google_voices", lambda: {"ru-RU-Wavenet-E": ["ru-RU"]}
+    )
+    return FakeClient
+
+
+@pytest.mark.asyncio
+async def test_synthesize_text_reuses_cached_chunks(tmp_path, fake_google_tts) -> None:
+    cache_dir = f"{tmp_path}/.cache/freespeech"
+    voice = Voice(character="Ada")
+
+    await speech.synthesize_text(
+        "Привет, мир.", None, voice, "ru-RU", tmp_path, cache_dir=cache_dir
+    )
+    assert fake_google_tts.calls == 1
+
+    # Chunks are cached outside of the cache for whole texts,
+    # so dropping the latter synthesizes the text from cached chunks.
+    shutil.rmtree(cache_dir)
+    _, _, is_cached = await speech.synthesize_text(
+        "Привет, мир.", None, voice, "ru-RU", tmp_path, cache_dir=cache_dir
+    )
+    assert not is_cached
+    assert fake_google_tts.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_synthesize_events_deduplicates(tmp_path, fake_google_tts) -> None:
+    events = [
+        Event(
+            time_ms=time_ms,
+            duration_ms=None,
+            chunks=["Привет, мир."],
+            voice=Voice(character="Ada"),
+        )
+        for time_ms in [0, 2_000, 4_500, 7_500]
+    ]
+
+    _, _, _, cache_hits = await speech.synthesize_events(
+        events=events,
+        lang="ru-RU",
+        output_dir=tmp_path,
+        cache_dir=f"{tmp_path}/.cache/freespeech",
+    )
+    assert fake_google_tts.calls == 1
+    assert cache_hits == [False, True, True, True]
+
+    _, _, _, cache_hits = await speech.synthesize_events(
+        events=events,
+        lang="ru-RU",
+        output_dir=tmp_path,
+        cache_dir=f"{tmp_path}/.cache/freespeech",
+        use_cache=False,
+    )
+    assert fake_google_tts.calls == 2
+    assert cache_hits == [False, False, False, False]
+
+
+@pytest.mark.asyncio
+async def test_synthesize_events_elevenlabs(tmp_path, monkeypatch) -> None:
+    voices = {"Volodymyr": "voice-id"}
+    get_voices_calls = 0
+    running = 0
+    max_running = 0
+
+    async def get_voices():
+        nonlocal get_voices_calls
+        get_voices_calls += 1
+        return voices
+
+    async def synthesize(text, voice, rate, output, voices=None):
+        nonlocal running, max_running
+        assert voices == {"Volodymyr": "voice-id"}
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        output_file = output / f"{hash.string(text)}.wav"
+        shutil.copyfile(AUDIO_EN_LOCAL, output_file)
+        return output_file
+
+    monkeypatch.setattr(elevenlabs, "get_voices", get_voices)
+    monkeypatch.setattr(elevenlabs, "synthesize", synthesize)
+
+    events = [
+        Event(
+            time_ms=time_ms,
+            duration_ms=None,
+            chunks=[f"Event {time_ms}."],
+            voice=Voice(character="Volodymyr"),
+        )
+        for time_ms in [0, 10_000, 20_000]
+    ]
+    await speech.synthesize_events(
+        events=events,
+        lang="en-US",
+        output_dir=tmp_path,
+        cache_dir=f"{tmp_path}/.cache/freespeech",
+    )
+
+    # ElevenLabs rejects requests over its rate limit, so they are sent
+    # one at a time and voices are requested once for all events.
+    assert get_voices_calls == 1
+    assert max_running == 1
+
+
+def test_voices_cache(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "google.json"
+    monkeypatch.setattr(speech, "_voices_cache_path", lambda name: path)
+    voices = {"ru-RU-Wavenet-E": ["ru-RU"]}
+
+    assert speech._read_cached_voices("google") is None
+    speech._write_cached_voices("google", voices)
+    assert speech._read_cached_voices("google") == voices
+
+    # expired
+    os.utime(path, (0, 0))
+    assert speech._read_cached_voices("google") is None
+
+    # not usable, e.g. created by another user
+    path.unlink()
+    path.mkdir()
+    assert speech._read_cached_voices("google") is None
+    speech._write_cached_voices("google", voices)
+    assert os.listdir(tmp_path) == ["google.json"]
@@ -25,6 +25,9 @@ def test_wrap_ssml():
         "<s>One. </s><s>Two.</s>"
         "</prosody></voice></speak>"
     )
+    assert speech.is_valid_ssml(
+        speech._wrap_in_ssml("One. Two.", voice="Bill", speech_rate=1.0)
+    )
 
 
 def test_parse_and_render():
@@ -116,6 +119,15 @@ def test_emojis_to_ssml_emotion_tags():
     assert speech._emojis_to_ssml_emotion_tags(text_in, "en-US") == text_out
 
 
+def test_emojis_to_ssml_emotion_tags_without_emojis():
+    # text without emojis doesn't need sentences to be split
+    assert (
+        speech._emojis_to_ssml_emotion_tags(" One. Two. ", "en-US")
+        == '<mstts:express-as style="calm">One. Two.</mstts:express-as>'
+    )
+    assert speech._emojis_to_ssml_emotion_tags("", "en-US") == ""
+
+
 def test_collect_and_remove_emojis():
     text_in = (
         "Wrap every sentence of the input text containing an allowed emoji "
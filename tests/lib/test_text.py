@@ -140,3 +140,33 @@ def test_capitalize_sentence() -> None:
 
 def test_sentences() -> None:
     assert text.sentences("Et zéro.", lang="fr-FR") == ["Et zéro"]
+
+
+def test_lemmas_batch() -> None:
+    texts = ["Hello world", "", "Hello  again"]
+    assert text.lemmas_batch(texts, lang="tr-TR") == [
+        text.lemmas(s, lang="tr-TR") for s in texts
+    ]
+
+
+def test_lemmas_batch_nlp() -> None:
+    # the pipeline runs without the parser and ner
+    texts = ["The cats were running home.", "", "She bought two mice, didn't she?"]
+    assert text.lemmas_batch(texts, lang="en-US") == [
+        text.lemmas(s, lang="en-US") for s in texts
+    ]
+
+
+def test_sentences_batch() -> None:
+    texts = ["One. Two.", "", "Three"]
+    assert text.sentences_batch(texts, lang="tr-TR") == [
+        text.sentences(s, lang="tr-TR") for s in texts
+    ]
+    assert text.sentences_batch([], lang="en-US") == []
+
+
+def test_sentences_batch_nlp() -> None:
+    texts = ["Hello world. How are you?", "", "Mr. Smith went home! Did he?"]
+    assert text.sentences_batch(texts, lang="en-US") == [
+        text.sentences(s, lang="en-US") for s in texts
+    ]